@@ -0,0 +1,58 @@
+"""Initial schema: resume_versions and job_applications
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-15 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0001'
+down_revision: Union[str, Sequence[str], None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "resume_versions",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("name", sa.String(100), nullable=False, unique=True),
+        sa.Column("file_path", sa.String(500), nullable=True),
+        sa.Column("content", sa.Text(), nullable=True),
+        sa.Column("description", sa.Text()),
+        sa.Column("is_default", sa.Boolean()),
+        sa.Column("created_at", sa.DateTime()),
+    )
+
+    op.create_table(
+        "job_applications",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("job_title", sa.String(200), nullable=False),
+        sa.Column("company_name", sa.String(200), nullable=False),
+        sa.Column("application_date", sa.Date(), nullable=False),
+        sa.Column("status", sa.String(50)),
+        sa.Column("job_url", sa.Text()),
+        sa.Column("salary_range", sa.String(100)),
+        sa.Column("location", sa.String(200)),
+        sa.Column("job_source", sa.String(100)),
+        sa.Column("recruiter_name", sa.String(200)),
+        sa.Column("recruiter_email", sa.String(200)),
+        sa.Column("next_followup_date", sa.Date()),
+        sa.Column("notes", sa.Text()),
+        sa.Column("resume_version_id", sa.Integer(), sa.ForeignKey("resume_versions.id")),
+        sa.Column("created_at", sa.DateTime()),
+        sa.Column("updated_at", sa.DateTime()),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("job_applications")
+    op.drop_table("resume_versions")
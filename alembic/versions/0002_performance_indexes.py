@@ -0,0 +1,55 @@
+"""Add trigram/listing indexes and a lower fillfactor for job_applications
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-15 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0002'
+down_revision: Union[str, Sequence[str], None] = '0001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    postgres = op.get_context().dialect.name == "postgresql"
+    if postgres:
+        op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+    op.create_index(
+        "ix_resume_default_partial", "resume_versions", ["is_default"],
+        postgresql_where=sa.text("is_default IS true"),
+    )
+    op.create_index("ix_job_app_date_desc", "job_applications", [sa.text("application_date DESC")])
+    op.create_index("ix_job_app_status", "job_applications", ["status"])
+    op.create_index(
+        "ix_company_trgm", "job_applications", ["company_name"],
+        postgresql_using="gin", postgresql_ops={"company_name": "gin_trgm_ops"},
+    )
+    op.create_index(
+        "ix_job_title_trgm", "job_applications", ["job_title"],
+        postgresql_using="gin", postgresql_ops={"job_title": "gin_trgm_ops"},
+    )
+
+    if postgres:
+        # Only affects pages written from now on; VACUUM FULL rewrites existing ones
+        op.execute("ALTER TABLE job_applications SET (fillfactor = 85)")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_context().dialect.name == "postgresql":
+        op.execute("ALTER TABLE job_applications RESET (fillfactor)")
+    op.drop_index("ix_job_title_trgm", table_name="job_applications")
+    op.drop_index("ix_company_trgm", table_name="job_applications")
+    op.drop_index("ix_job_app_status", table_name="job_applications")
+    op.drop_index("ix_job_app_date_desc", table_name="job_applications")
+    op.drop_index("ix_resume_default_partial", table_name="resume_versions")
@@ -0,0 +1,32 @@
+"""Replace the status index with a (status, application_date DESC) index
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-15 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0003'
+down_revision: Union[str, Sequence[str], None] = '0002'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        "ix_job_app_status_date", "job_applications", ["status", sa.text("application_date DESC")]
+    )
+    op.drop_index("ix_job_app_status", table_name="job_applications")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index("ix_job_app_status", "job_applications", ["status"])
+    op.drop_index("ix_job_app_status_date", table_name="job_applications")
@@ -0,0 +1,46 @@
+"""Set job_applications.updated_at in a trigger
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-15 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0004'
+down_revision: Union[str, Sequence[str], None] = '0003'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # plpgsql trigger; other backends keep updated_at current from the ORM
+    if op.get_context().dialect.name != "postgresql":
+        return
+    op.execute("""
+        CREATE OR REPLACE FUNCTION job_applications_set_updated_at() RETURNS trigger AS $$
+        BEGIN
+          NEW.updated_at = timezone('utc', now());
+          RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    op.execute("DROP TRIGGER IF EXISTS job_applications_updated_at ON job_applications")
+    op.execute("""
+        CREATE TRIGGER job_applications_updated_at
+          BEFORE UPDATE ON job_applications
+          FOR EACH ROW EXECUTE FUNCTION job_applications_set_updated_at()
+    """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_context().dialect.name != "postgresql":
+        return
+    op.execute("DROP TRIGGER IF EXISTS job_applications_updated_at ON job_applications")
+    op.execute("DROP FUNCTION IF EXISTS job_applications_set_updated_at()")
@@ -6,47 +6,87 @@ import sys
 import os
 import signal
 import asyncio
+import atexit
 import logging
+import queue
+from logging.handlers import MemoryHandler, QueueHandler, QueueListener
 
-# Set up logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('/tmp/job_tracker_mcp.log'),
-        logging.StreamHandler(sys.stderr)
-    ]
-)
+try:
+    import uvloop  # Faster libuv-based event loop (not available on Windows)
+except ImportError:
+    uvloop = None
 
 logger = logging.getLogger(__name__)
 
+def _setup_logging():
+    """Buffer file writes (flushing every 1024 records or on ERROR) behind a queue listener"""
+    log_formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    file_handler = logging.FileHandler('/tmp/job_tracker_mcp.log')
+    file_handler.setFormatter(log_formatter)
+    buffered_handler = MemoryHandler(capacity=1024, flushLevel=logging.ERROR, target=file_handler, flushOnClose=True)
+    atexit.register(buffered_handler.flush)
+
+    stderr_handler = logging.StreamHandler(sys.stderr)
+    stderr_handler.setFormatter(log_formatter)
+    stderr_handler.setLevel(logging.WARNING)
+
+    # Loggers only enqueue records; a listener thread does the formatting and I/O
+    log_queue = queue.SimpleQueue()
+    log_listener = QueueListener(log_queue, buffered_handler, stderr_handler, respect_handler_level=True)
+    log_listener.start()
+    atexit.register(log_listener.stop)
+
+    queue_handler = QueueHandler(log_queue)
+    queue_handler.setFormatter(logging.Formatter('%(message)s'))  # Full format is applied by the listener
+    logging.basicConfig(level=logging.INFO, handlers=[queue_handler], force=True)
+
+def _bootstrap():
+    """Configure logging, Python path and environment for the server process"""
+    _setup_logging()
+
+    # Add the project directory to Python path
+    project_dir = os.path.dirname(os.path.abspath(__file__))
+    sys.path.insert(0, project_dir)
+    logger.info(f"Project directory: {project_dir}")
+
+    # Set environment variables
+    os.environ['PYTHONPATH'] = project_dir
+    logger.info("Environment variables set")
+
 def signal_handler(signum, frame):
-    """Handle shutdown signals with immediate exit"""
+    """Handle shutdown signals with immediate exit (used where the loop can't take signal handlers)"""
     logger.info(f"Received signal {signum}, shutting down immediately...")
     sys.exit(0)
 
-def run_server():
-    """Entry point with immediate signal handling"""
+async def _serve():
+    """Run the MCP server, cancelling it from inside the loop on shutdown signals"""
+    from src.server import main
+
+    loop = asyncio.get_running_loop()
+    server_task = asyncio.current_task()
     try:
-        # Add the project directory to Python path
-        project_dir = os.path.dirname(os.path.abspath(__file__))
-        sys.path.insert(0, project_dir)
-        logger.info(f"Project directory: {project_dir}")
-
-        # Set environment variables
-        os.environ['PYTHONPATH'] = project_dir
-        logger.info("Environment variables set")
-        
-        # Set up signal handlers for immediate shutdown
+        for signum in (signal.SIGINT, signal.SIGTERM):
+            loop.add_signal_handler(signum, server_task.cancel)
+    except NotImplementedError:
+        # Windows event loops don't support add_signal_handler
         signal.signal(signal.SIGINT, signal_handler)
         signal.signal(signal.SIGTERM, signal_handler)
-        
+
+    await main()
+
+def run_server():
+    """Entry point with immediate signal handling"""
+    try:
+        _bootstrap()
+
         logger.info("Starting MCP server...")
-        
-        # Import and run the server directly
-        from src.server import main
-        asyncio.run(main())
-        
+
+        with asyncio.Runner(loop_factory=uvloop.new_event_loop if uvloop else None) as runner:
+            try:
+                runner.run(_serve())
+            except asyncio.CancelledError:
+                logger.info("Shutdown signal received, exiting...")
+
     except KeyboardInterrupt:
         logger.info("Keyboard interrupt received, exiting...")
         sys.exit(0)
@@ -57,4 +97,4 @@ def run_server():
         sys.exit(1)
 
 if __name__ == "__main__":
-    run_server()
\ No newline at end of file
+    run_server()
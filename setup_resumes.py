@@ -1,4 +1,4 @@
-from src.database import db
+from src.database import DatabaseManager
 
 def setup_default_resume():
     """Set up your default resume"""
@@ -29,24 +29,21 @@ EDUCATION:
 """
     
     try:
+        # One-shot script: no need to keep a pool of connections around
+        db = DatabaseManager(pool="null")
+        
         # Create tables first
         db.create_tables()
         
-        # Check if default resume exists
-        existing = db.get_resume_by_name("default")
-        if existing:
-            print("✅ Default resume already exists")
-            return existing
-        
-        # Add default resume
-        resume = db.add_resume_with_content(
+        # Add default resume (no-op if it already exists)
+        resume = db.upsert_resume(
             name="default",
             content=default_resume_content.strip(),
             description="My standard software engineer resume",
             is_default=True
         )
         
-        print(f"✅ Default resume created: {resume.name} (ID: {resume.id})")
+        print(f"✅ Default resume ready: {resume.name} (ID: {resume.id})")
         return resume
         
     except Exception as e:
@@ -1,179 +1,549 @@
-from sqlalchemy import create_engine, text
-from sqlalchemy.orm import sessionmaker, Session, joinedload
-from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy import create_engine, bindparam, case, func, inspect, literal_column, make_url, text, select, insert, update, or_, Row
+from sqlalchemy.orm import sessionmaker, Session, aliased, joinedload, selectinload, undefer_group
+from sqlalchemy.orm.attributes import set_committed_value
+from sqlalchemy.pool import NullPool, QueuePool
+from sqlalchemy.dialects import postgresql, sqlite
 from dotenv import load_dotenv
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import cache
 import os
-from typing import List, Optional
+import sys
+import threading
+import time
+from typing import Dict, Iterator, List, Optional, Tuple
 from datetime import date, datetime
 
 from .models import Base, JobApplication, ResumeVersion, JobApplicationCreate, ResumeVersionCreate
 
-load_dotenv()
+# Session shared by every session_scope() inside DatabaseManager.request_scope() (visible to asyncio.to_thread workers)
+_request_session: ContextVar[Optional[Session]] = ContextVar("job_tracker_request_session", default=None)
+
+@cache
+def _load_env():
+    """Read .env once per process, without overriding variables already set"""
+    load_dotenv(override=False)
 
 class DatabaseManager:
-    def __init__(self):
+    # Seconds a cached resume lookup or stats result stays valid
+    _CACHE_TTL = 30.0
+    
+    def __init__(self, pool: str = "queue"):
+        """pool="null" opens a fresh connection per checkout, for one-shot scripts"""
+        _load_env()
         self.database_url = os.getenv('DATABASE_URL')
-        self.engine = create_engine(self.database_url)
-        self.SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=self.engine)
+        self.pool_size = int(os.getenv('DB_POOL_SIZE', '25'))
+        self.max_overflow = int(os.getenv('DB_MAX_OVERFLOW', '25'))
+        self.engine = create_engine(self.database_url, **self._engine_options(pool))
+        self.SessionLocal = sessionmaker(autocommit=False, autoflush=False, expire_on_commit=False, bind=self.engine)
+        self._resume_cache: Dict[str, Tuple[float, ResumeVersion]] = {}
+        self._resume_list_cache: Tuple[float, Optional[List[ResumeVersion]]] = (0.0, None)
+        self._stats_cache: Tuple[float, Optional[tuple]] = (0.0, None)
+        # Bumped on every invalidation so a read that overlapped a write isn't cached
+        self._resume_generation = 0
+        self._stats_generation = 0
+        self._cache_lock = threading.Lock()
+        self._tables_ready = False
+        
+    def _engine_options(self, pool: str) -> dict:
+        """Engine settings; pool size is tunable via DB_POOL_SIZE / DB_MAX_OVERFLOW"""
+        url = make_url(self.database_url)
+        # Room for every compiled statement shape we issue, with plenty to spare
+        options = {"query_cache_size": 1200}
+        
+        if url.get_backend_name() == "postgresql":
+            # Cap runaway queries at 5 seconds (create_tables lifts this for its DDL)
+            connect_args = {"options": "-c statement_timeout=5000"}
+            if url.get_driver_name() == "psycopg":
+                # psycopg 3 prepares a statement server-side after its 3rd execution
+                connect_args["prepare_threshold"] = 3
+            options["connect_args"] = connect_args
+        
+        if pool == "null":
+            options["poolclass"] = NullPool
+        elif url.get_backend_name() != "sqlite":
+            options.update(
+                pool_size=self.pool_size,
+                max_overflow=self.max_overflow,
+                pool_pre_ping=True,
+                pool_recycle=1800,
+                pool_use_lifo=True,
+            )
+        return options
         
     def create_tables(self):
-        """Create all tables in the database"""
-        Base.metadata.create_all(bind=self.engine)
-        print("✅ Database tables created successfully!")
+        """Create all tables in the database (checked once per process)"""
+        if self._tables_ready:
+            return
+        
+        # Schema is managed by Alembic; skip DDL/reflection when it's already in place
+        if not inspect(self.engine).has_table(JobApplication.__tablename__):
+            with self.engine.begin() as conn:
+                if self.engine.dialect.name == "postgresql":
+                    # The 5 second statement_timeout is meant for tool calls, not index builds
+                    conn.execute(text("SET LOCAL statement_timeout = 0"))
+                    # Trigram indexes on company/job title need pg_trgm
+                    conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+                Base.metadata.create_all(bind=conn)
+                self._stamp_schema_head(conn)
+            # stderr, since stdout carries the MCP stdio protocol
+            print("✅ Database tables created successfully!", file=sys.stderr)
+        self._tables_ready = True
+    
+    def _stamp_schema_head(self, conn):
+        """Mark a schema built by create_all as the latest Alembic revision, so `alembic upgrade head` skips it"""
+        from alembic.migration import MigrationContext
+        from alembic.script import ScriptDirectory
+        
+        script = ScriptDirectory(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "alembic"))
+        MigrationContext.configure(conn).stamp(script, "head")
+    
+    def warm_pool(self):
+        """Open DB_POOL_WARM (default 5) pooled connections up front so early tool calls skip connect latency"""
+        if not isinstance(self.engine.pool, QueuePool):
+            return
+        size = min(int(os.getenv('DB_POOL_WARM', '5')), self.engine.pool.size())
+        connections = [self.engine.connect() for _ in range(size)]
+        for connection in connections:
+            connection.close()
         
     def get_session(self) -> Session:
         """Get a database session"""
         return self.SessionLocal()
     
-    # Resume Version Operations
-    def add_resume_version(self, resume_data: ResumeVersionCreate) -> ResumeVersion:
-        """Add a new resume version"""
+    @contextmanager
+    def session_scope(self):
+        """Provide a transactional scope around a series of operations"""
+        shared = _request_session.get()
+        if shared is not None:
+            # Inside request_scope(): flush so ids and errors show up now; the commit happens once at the end
+            try:
+                yield shared
+                shared.flush()
+            except Exception:
+                shared.rollback()
+                shared.info["rolled_back"] = True
+                raise
+            return
+        
         session = self.get_session()
         try:
-            # If this is set as default, unset all other defaults
-            if resume_data.is_default:
-                session.query(ResumeVersion).update({"is_default": False})
-            
-            resume = ResumeVersion(**resume_data.dict())
-            session.add(resume)
+            yield session
             session.commit()
-            session.refresh(resume)
-            return resume
-        except SQLAlchemyError as e:
+        except Exception:
             session.rollback()
-            raise e
+            raise
         finally:
             session.close()
     
-    def get_default_resume(self) -> Optional[ResumeVersion]:
-        """Get the default resume version"""
+    @contextmanager
+    def request_scope(self) -> Iterator[Session]:
+        """Run every session_scope() in this block on one session and transaction, committed once at the end;
+        an error in any of them rolls back the whole block (check session.info["rolled_back"])"""
         session = self.get_session()
+        token = _request_session.set(session)
         try:
-            return session.query(ResumeVersion).filter(ResumeVersion.is_default == True).first()
+            yield session
+            session.commit()
+        except Exception:
+            session.rollback()
+            raise
         finally:
+            _request_session.reset(token)
             session.close()
+            # Anything cached inside the block may have seen uncommitted or rolled-back rows
+            self._invalidate_resume_cache()
+            self._invalidate_stats_cache()
+    
+    # Resume Version Operations
+    def add_resume_version(self, resume_data: ResumeVersionCreate) -> ResumeVersion:
+        """Add a new resume version"""
+        with self.session_scope() as session:
+            # If this is set as default, unset the current default (if any)
+            if resume_data.is_default:
+                session.query(ResumeVersion).filter(
+                    ResumeVersion.is_default == True,
+                    ResumeVersion.name != resume_data.name
+                ).update({"is_default": False}, synchronize_session=False)
+            
+            resume = ResumeVersion(**dict(resume_data))
+            session.add(resume)
+        
+        self._invalidate_resume_cache()
+        return resume
+    
+    def bulk_add_resume_versions(self, items: List[ResumeVersionCreate]) -> List[ResumeVersion]:
+        """Add many resume versions in a single transaction, in the order given"""
+        if not items:
+            return []
+        
+        # Only one resume can be the default; the last one flagged wins
+        default_name = next((item.name for item in reversed(items) if item.is_default), None)
+        rows = [dict(item, is_default=item.name == default_name) for item in items]
+        
+        with self.session_scope() as session:
+            if default_name:
+                session.query(ResumeVersion).filter(
+                    ResumeVersion.is_default == True
+                ).update({"is_default": False}, synchronize_session=False)
+            
+            stmt = insert(ResumeVersion).returning(ResumeVersion, sort_by_parameter_order=True).options(undefer_group("body"))
+            resumes = list(session.scalars(stmt, rows))
+        
+        self._invalidate_resume_cache()
+        return resumes
+    
+    def upsert_resume(self, name: str, content: Optional[str] = None, description: Optional[str] = None,
+                      is_default: bool = False) -> ResumeVersion:
+        """Create a resume unless one with this name already exists, returning the stored row"""
+        dialect_insert = sqlite.insert if self.engine.dialect.name == "sqlite" else postgresql.insert
+        stmt = dialect_insert(ResumeVersion).values(
+            name=name, content=content, description=description, is_default=is_default
+        ).on_conflict_do_nothing(index_elements=["name"]).returning(ResumeVersion).options(undefer_group("body"))
+        
+        with self.session_scope() as session:
+            resume = session.scalars(stmt).one_or_none()
+            if resume is None:
+                # Already present; leave it untouched
+                return self._get_resume_by_name(session, name)
+            
+            if is_default:
+                session.query(ResumeVersion).filter(
+                    ResumeVersion.is_default == True,
+                    ResumeVersion.name != name
+                ).update({"is_default": False}, synchronize_session=False)
+        
+        self._invalidate_resume_cache()
+        return resume
+    
+    def _get_default_resume(self, session: Session) -> Optional[ResumeVersion]:
+        return session.query(ResumeVersion).options(
+            undefer_group("body")
+        ).filter(ResumeVersion.is_default == True).first()
+    
+    def _get_resume_by_name(self, session: Session, name: str) -> Optional[ResumeVersion]:
+        return session.query(ResumeVersion).options(
+            undefer_group("body")
+        ).filter(ResumeVersion.name == name).first()
+    
+    def _invalidate_resume_cache(self):
+        with self._cache_lock:
+            self._resume_generation += 1
+            self._resume_cache.clear()
+            self._resume_list_cache = (0.0, None)
+    
+    def get_default_resume(self) -> Optional[ResumeVersion]:
+        """Get the default resume version"""
+        with self.session_scope() as session:
+            return self._get_default_resume(session)
     
     def get_resume_by_name(self, name: str) -> Optional[ResumeVersion]:
-        """Get resume version by name"""
-        session = self.get_session()
-        try:
-            return session.query(ResumeVersion).filter(ResumeVersion.name == name).first()
-        finally:
-            session.close()
+        """Get resume version by name (cached for a few seconds)"""
+        cached = self._resume_cache.get(name)
+        if cached and time.monotonic() - cached[0] < self._CACHE_TTL:
+            return cached[1]
+        
+        generation = self._resume_generation
+        with self.session_scope() as session:
+            resume = self._get_resume_by_name(session, name)
+        if resume is not None:
+            with self._cache_lock:
+                if generation == self._resume_generation:
+                    self._resume_cache[name] = (time.monotonic(), resume)
+        return resume
     
     def list_resumes(self) -> List[ResumeVersion]:
-        """Get all resume versions"""
-        session = self.get_session()
-        try:
-            return session.query(ResumeVersion).order_by(ResumeVersion.created_at.desc()).all()
-        finally:
-            session.close()
+        """Get all resume versions (cached for a few seconds)"""
+        cached_at, resumes = self._resume_list_cache
+        if resumes is not None and time.monotonic() - cached_at < self._CACHE_TTL:
+            return resumes
+        
+        generation = self._resume_generation
+        with self.session_scope() as session:
+            resumes = session.query(ResumeVersion).order_by(ResumeVersion.created_at.desc()).all()
+        with self._cache_lock:
+            if generation == self._resume_generation:
+                self._resume_list_cache = (time.monotonic(), resumes)
+        return resumes
     
     def set_resume_as_default(self, resume_name: str) -> bool:
-        """Set a specific resume as the default"""
-        session = self.get_session()
-        try:
-            # First, unset all defaults
-            session.query(ResumeVersion).update({"is_default": False})
-            
-            # Then set the specified resume as default
-            resume = session.query(ResumeVersion).filter(ResumeVersion.name == resume_name).first()
-            if resume:
-                resume.is_default = True
-                session.commit()
-                return True
-            else:
-                session.rollback()
-                return False
-        except SQLAlchemyError as e:
-            session.rollback()
-            raise e
-        finally:
-            session.close()
+        """Set a specific resume as the default; returns False if no resume has that name"""
+        target = aliased(ResumeVersion)
+        # One UPDATE flips the old default off and this one on; rows already
+        # correct are skipped, and nothing changes if the name doesn't exist
+        stmt = update(ResumeVersion).where(
+            or_(ResumeVersion.is_default == True, ResumeVersion.name == resume_name),
+            select(target.id).where(target.name == resume_name).exists()
+        ).values(
+            is_default=case((ResumeVersion.name == resume_name, True), else_=False)
+        ).execution_options(synchronize_session=False)
+        
+        with self.session_scope() as session:
+            updated = session.execute(stmt).rowcount > 0
+        
+        if updated:
+            self._invalidate_resume_cache()
+        return updated
     
     # Job Application Operations
-    def add_job_application(self, app_data: JobApplicationCreate) -> JobApplication:
+    def _resume_id_subquery(self, resume_name: Optional[str]):
+        """Resume id for the given name, falling back to the default resume"""
+        query = select(ResumeVersion.id)
+        if resume_name:
+            # Prefer the named resume; the default is only used if it doesn't exist
+            query = query.where(or_(ResumeVersion.name == resume_name, ResumeVersion.is_default == True))
+            query = query.order_by((ResumeVersion.name == resume_name).desc())
+        else:
+            query = query.where(ResumeVersion.is_default == True)
+        return query.limit(1).scalar_subquery()
+    
+    def add_job_application(self, app_data: JobApplicationCreate, session: Optional[Session] = None) -> JobApplication:
         """Add a new job application"""
-        session = self.get_session()
-        try:
-            # Handle resume version
-            resume_version = None
-            if app_data.resume_version_name:
-                resume_version = self.get_resume_by_name(app_data.resume_version_name)
-                if not resume_version:
-                    # If specified resume doesn't exist, try default
-                    resume_version = self.get_default_resume()
-            else:
-                # No specific resume mentioned, use default if available
-                resume_version = self.get_default_resume()
-            
-            # Create application
-            app_dict = app_data.dict()
-            app_dict.pop('resume_version_name', None)  # Remove this field
-            
-            application = JobApplication(**app_dict)
-            if resume_version:
-                application.resume_version_id = resume_version.id
-            
-            session.add(application)
-            session.commit()
-            session.refresh(application)
+        if session is None:
+            with self.session_scope() as session:
+                application = self.add_job_application(app_data, session)
+            self._invalidate_stats_cache()
+            return application
+        
+        # Create application, resolving the resume version in the same statement
+        # Fields are plain values, so a shallow dict(...) is enough (no model_dump serialization pass)
+        app_dict = dict(app_data)
+        resume_version_name = app_dict.pop('resume_version_name', None)
+        app_dict['resume_version_id'] = self._resume_id_subquery(resume_version_name)
+        
+        # RETURNING also carries the resolved resume's name, so callers don't need a second lookup
+        resume_name = select(ResumeVersion.name).where(
+            ResumeVersion.id == literal_column("job_applications.resume_version_id")
+        ).scalar_subquery()
+        stmt = insert(JobApplication).values(**app_dict).returning(JobApplication, resume_name)
+        application, name = session.execute(stmt).one()
+        set_committed_value(application, "resume_name", name)
+        return application
+    
+    def update_application_status(self, app_id: int, new_status: str, notes: Optional[str] = None) -> Optional[Tuple[JobApplication, str]]:
+        """Update an application's status, appending dated notes; returns (application, old_status)"""
+        with self.session_scope() as session:
+            updated = self._update_application_status(session, app_id, new_status, notes)
+        
+        if updated:
+            self._invalidate_stats_cache()
+        return updated
+    
+    def _update_application_status(self, session: Session, app_id: int, new_status: str,
+                                   notes: Optional[str]) -> Optional[Tuple[JobApplication, str]]:
+        tagged = f"[{date.today().isoformat()}] {notes}" if notes else None
+        
+        if self.engine.dialect.name == "postgresql":
+            # One UPDATE ... RETURNING; the locked subquery row still holds the pre-update status
+            prev = select(JobApplication.id, JobApplication.status).where(
+                JobApplication.id == app_id
+            ).with_for_update().subquery("prev")
+            values = {"status": new_status}
+            if tagged:
+                values["notes"] = case(
+                    (func.coalesce(JobApplication.notes, "") == "", tagged),
+                    else_=JobApplication.notes + "\n" + tagged
+                )
+            stmt = update(JobApplication).where(
+                JobApplication.id == prev.c.id
+            ).values(**values).returning(JobApplication, prev.c.status).execution_options(synchronize_session=False)
+            row = session.execute(stmt).first()
+            return tuple(row) if row else None
+        
+        application = session.get(JobApplication, app_id)
+        if not application:
+            return None
+        
+        old_status = application.status
+        application.status = new_status
+        
+        if tagged:
+            application.notes = f"{application.notes}\n{tagged}" if application.notes else tagged
+        
+        return application, old_status
+    
+    def bulk_add_job_applications(self, items: List[JobApplicationCreate]) -> List[int]:
+        """Add many job applications in a single transaction, returning their ids"""
+        if not items:
+            return []
+        
+        with self.session_scope() as session:
+            # Resolve every referenced resume name (and the default) in one query
+            names = {item.resume_version_name for item in items if item.resume_version_name}
+            resume_ids = {}
+            default_id = None
+            for resume_id, name, is_default in session.execute(
+                select(ResumeVersion.id, ResumeVersion.name, ResumeVersion.is_default).where(
+                    or_(ResumeVersion.name.in_(names), ResumeVersion.is_default == True)
+                )
+            ):
+                resume_ids[name] = resume_id
+                if is_default:
+                    default_id = resume_id
             
-            # Eagerly load the resume_version relationship before closing session
-            if application.resume_version_id:
-                _ = application.resume_version.name  # This loads the relationship
+            rows = []
+            for item in items:
+                row = dict(item)
+                resume_version_name = row.pop('resume_version_name', None)
+                row['resume_version_id'] = resume_ids.get(resume_version_name, default_id)
+                rows.append(row)
             
-            return application
-        except SQLAlchemyError as e:
-            session.rollback()
-            raise e
-        finally:
-            session.close()
+            ids = list(session.scalars(insert(JobApplication).returning(JobApplication.id, sort_by_parameter_order=True), rows))
+        
+        self._invalidate_stats_cache()
+        return ids
     
     def get_application_with_resume(self, application_id: int) -> Optional[JobApplication]:
         """Get application with resume version eagerly loaded"""
-        session = self.get_session()
-        try:
+        with self.session_scope() as session:
             return session.query(JobApplication).options(
                 joinedload(JobApplication.resume_version)
             ).filter(JobApplication.id == application_id).first()
-        finally:
-            session.close()
 
-    def get_all_applications_with_resumes(self) -> List[JobApplication]:
-        """Get all applications with resume versions eagerly loaded"""
-        session = self.get_session()
-        try:
-            return session.query(JobApplication).options(
-                joinedload(JobApplication.resume_version)
-            ).order_by(JobApplication.application_date.desc()).all()
-        finally:
-            session.close()
+    def get_all_applications_with_resumes(self, limit: Optional[int] = None,
+                                          batch_size: int = 200) -> Iterator[JobApplication]:
+        """Yield all applications (newest first, optionally only the first `limit`) with resume names,
+        fetched `batch_size` rows at a time through a server-side cursor"""
+        # Listings only show the resume name, so that's all that gets loaded (one IN query per batch)
+        stmt = select(JobApplication).options(
+            selectinload(JobApplication.resume_version).load_only(ResumeVersion.name)
+        ).order_by(JobApplication.application_date.desc())
+        if limit is not None:
+            stmt = stmt.limit(limit)
+        
+        with self.session_scope() as session:
+            yield from session.scalars(stmt.execution_options(stream_results=True, yield_per=batch_size))
 
-    def get_applications_by_status(self, status: str) -> List[JobApplication]:
-        """Get applications by status"""
-        session = self.get_session()
-        try:
-            return session.query(JobApplication).options(
-                joinedload(JobApplication.resume_version)
-            ).filter(JobApplication.status == status).all()
-        finally:
-            session.close()
+    # Aggregates for application stats; pass a session to run several in one transaction
+    def _invalidate_stats_cache(self):
+        with self._cache_lock:
+            self._stats_generation += 1
+            self._stats_cache = (0.0, None)
     
-    def search_applications(self, company_name: str = None, job_title: str = None) -> List[JobApplication]:
-        """Search applications by company or job title"""
-        session = self.get_session()
-        try:
+    def get_application_stats(self) -> Tuple[int, Counter, List[Tuple[str, int]], Counter]:
+        """Get (total, status counts, top 5 companies, resume usage counts) in one transaction (cached for a few seconds)"""
+        cached_at, stats = self._stats_cache
+        if stats is not None and time.monotonic() - cached_at < self._CACHE_TTL:
+            return stats
+        
+        generation = self._stats_generation
+        with self.session_scope() as session:
+            status_counts = self.get_status_counts(session)
+            if not status_counts:
+                stats = (0, status_counts, [], Counter())
+            else:
+                # Every application falls in exactly one status group, so no separate COUNT(*) is needed
+                stats = (
+                    sum(status_counts.values()),
+                    status_counts,
+                    self.get_top_companies(5, session),
+                    self.get_resume_usage_counts(session),
+                )
+        with self._cache_lock:
+            if generation == self._stats_generation:
+                self._stats_cache = (time.monotonic(), stats)
+        return stats
+    
+    def get_status_counts(self, session: Optional[Session] = None) -> Counter:
+        """Get the number of applications per status (missing statuses count as 0)"""
+        if session is None:
+            with self.session_scope() as session:
+                return self.get_status_counts(session)
+        return Counter(dict(
+            session.query(JobApplication.status, func.count(JobApplication.id)).group_by(JobApplication.status).all()
+        ))
+
+    def get_top_companies(self, n: int = 5, session: Optional[Session] = None) -> List[Tuple[str, int]]:
+        """Get the n companies with the most applications"""
+        if session is None:
+            with self.session_scope() as session:
+                return self.get_top_companies(n, session)
+        count = func.count(JobApplication.id)
+        return [
+            tuple(row) for row in session.query(JobApplication.company_name, count).group_by(
+                JobApplication.company_name
+            ).order_by(count.desc(), JobApplication.company_name).limit(n).all()
+        ]
+
+    def get_resume_usage_counts(self, session: Optional[Session] = None) -> Counter:
+        """Get the number of applications per resume name (None for applications without a resume)"""
+        if session is None:
+            with self.session_scope() as session:
+                return self.get_resume_usage_counts(session)
+        return Counter(dict(
+            session.query(ResumeVersion.name, func.count(JobApplication.id)).select_from(JobApplication).join(
+                ResumeVersion, isouter=True
+            ).group_by(ResumeVersion.name).all()
+        ))
+
+    def get_applications_by_status(self, status: str, limit: Optional[int] = None) -> List[JobApplication]:
+        """Get applications by status (resume names eagerly loaded), newest first"""
+        return self.search_applications(status=status, limit=limit)
+    
+    def _search_filters(self, company_name: Optional[str], job_title: Optional[str], status: Optional[str]) -> list:
+        """WHERE clauses shared by the search methods"""
+        filters = []
+        # On Postgres these unanchored ILIKEs are served by the gin_trgm_ops
+        # indexes (ix_company_trgm / ix_job_title_trgm) rather than a seq scan
+        if company_name:
+            filters.append(JobApplication.company_name.ilike(f"%{company_name}%"))
+        if job_title:
+            filters.append(JobApplication.job_title.ilike(f"%{job_title}%"))
+        if status:
+            filters.append(JobApplication.status == status)
+        return filters
+    
+    def search_applications(self, company_name: str = None, job_title: str = None,
+                            status: str = None, limit: Optional[int] = None) -> List[JobApplication]:
+        """Search applications by company, job title and/or status, newest first (resume names eagerly loaded)"""
+        with self.session_scope() as session:
             query = session.query(JobApplication).options(
-                joinedload(JobApplication.resume_version)
-            )
-            if company_name:
-                query = query.filter(JobApplication.company_name.ilike(f"%{company_name}%"))
-            if job_title:
-                query = query.filter(JobApplication.job_title.ilike(f"%{job_title}%"))
-            return query.order_by(JobApplication.application_date.desc()).all()
-        finally:
-            session.close()
+                joinedload(JobApplication.resume_version).load_only(ResumeVersion.name)
+            ).filter(*self._search_filters(company_name, job_title, status))
+            query = query.order_by(JobApplication.application_date.desc())
+            if limit is not None:
+                query = query.limit(limit)
+            return query.all()
+    
+    # Columns for application listings; resume name comes from the outer join
+    _APPLICATION_ROWS = select(
+        JobApplication.id,
+        JobApplication.job_title,
+        JobApplication.company_name,
+        JobApplication.application_date,
+        JobApplication.status,
+        JobApplication.salary_range,
+        JobApplication.notes,
+        ResumeVersion.name.label("resume_name")
+    ).join(ResumeVersion, isouter=True).order_by(JobApplication.application_date.desc())
+    
+    # Unfiltered "latest N" listing, built once; only the bound limit changes per call
+    _LATEST_APPLICATION_ROWS = _APPLICATION_ROWS.limit(bindparam("limit"))
+    
+    def search_application_rows(self, company_name: str = None, job_title: str = None,
+                                status: str = None, limit: Optional[int] = None) -> List[Row]:
+        """Like search_applications, but returns plain (id, job_title, company_name, application_date,
+        status, salary_range, notes, resume_name) rows instead of ORM objects"""
+        stmt = self._APPLICATION_ROWS.where(*self._search_filters(company_name, job_title, status))
+        if limit is not None:
+            stmt = stmt.limit(limit)
+        
+        with self.session_scope() as session:
+            return session.execute(stmt).all()
+    
+    def latest_applications(self, limit: int) -> List[Row]:
+        """The newest `limit` applications as search_application_rows-style rows (no filters)"""
+        with self.session_scope() as session:
+            return session.execute(self._LATEST_APPLICATION_ROWS, {"limit": limit}).all()
+
+# Global database instance, created on first use
+@cache
+def get_db() -> DatabaseManager:
+    return DatabaseManager()
 
-# Global database instance
-db = DatabaseManager()
\ No newline at end of file
+def __getattr__(name):
+    # Keep `from .database import db` working without building the engine at import time
+    if name == "db":
+        return get_db()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,9 +1,9 @@
-from sqlalchemy import create_engine, Column, Integer, String, Date, DateTime, Text, Boolean, ForeignKey
+from sqlalchemy import create_engine, Column, Integer, String, Date, DateTime, Text, Boolean, ForeignKey, Index, DDL, FetchedValue, event
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import relationship, sessionmaker
+from sqlalchemy.orm import relationship, sessionmaker, deferred, query_expression
 from datetime import datetime, date
 from typing import Optional
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 Base = declarative_base()
 
@@ -14,7 +14,7 @@ class ResumeVersion(Base):
   id = Column(Integer, primary_key=True)
   name = Column(String(100), nullable=False, unique=True)
   file_path = Column(String(500), nullable=True)  # Made nullable
-  content = Column(Text, nullable=True)  # Add this line for text content
+  content = deferred(Column(Text, nullable=True), group="body")  # Full resume text; only loaded on demand
   description = Column(Text)
   is_default = Column(Boolean, default=False)
   created_at = Column(DateTime, default=datetime.utcnow)
@@ -24,6 +24,8 @@ class ResumeVersion(Base):
 
 class JobApplication(Base):
   __tablename__ = "job_applications"
+  # Leave room on each page so status/notes updates stay HOT
+  __table_args__ = {"postgresql_with": {"fillfactor": 85}}
   
   id = Column(Integer, primary_key=True)
   job_title = Column(String(200), nullable=False)
@@ -48,10 +50,47 @@ class JobApplication(Base):
   # Resume version used
   resume_version_id = Column(Integer, ForeignKey("resume_versions.id"))
   resume_version = relationship("ResumeVersion", back_populates="applications")
+  resume_name = query_expression()  # Only populated where a query asks for it (e.g. add_job_application)
   
   # Timestamps
   created_at = Column(DateTime, default=datetime.utcnow)
-  updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+  updated_at = Column(DateTime, default=datetime.utcnow, server_onupdate=FetchedValue())  # Set by trigger (see below)
+
+# Keep updated_at current on the database side instead of in Python
+# (existing databases get this from migration 0004)
+event.listen(
+  JobApplication.__table__,
+  "after_create",
+  DDL("""
+    CREATE OR REPLACE FUNCTION job_applications_set_updated_at() RETURNS trigger AS $$
+    BEGIN
+      NEW.updated_at = timezone('utc', now());
+      RETURN NEW;
+    END;
+    $$ LANGUAGE plpgsql;
+
+    CREATE TRIGGER job_applications_updated_at
+      BEFORE UPDATE ON job_applications
+      FOR EACH ROW EXECUTE FUNCTION job_applications_set_updated_at();
+  """).execute_if(dialect="postgresql")
+)
+
+# SQLite has no trigger, so ORM flushes set updated_at there instead
+def _touch_updated_at(mapper, connection, target):
+  if connection.dialect.name != "postgresql":
+    target.updated_at = datetime.utcnow()
+
+event.listen(JobApplication, "before_update", _touch_updated_at)
+
+# Indexes for the filters and orderings used in database.py
+Index("ix_job_app_date_desc", JobApplication.application_date.desc())
+# Status filters are always ordered newest first, so the index carries the date too
+Index("ix_job_app_status_date", JobApplication.status, JobApplication.application_date.desc())
+Index("ix_resume_default_partial", ResumeVersion.is_default, postgresql_where=ResumeVersion.is_default.is_(True))
+
+# Trigram indexes back the ILIKE '%...%' searches (requires pg_trgm)
+Index("ix_company_trgm", JobApplication.company_name, postgresql_using="gin", postgresql_ops={"company_name": "gin_trgm_ops"})
+Index("ix_job_title_trgm", JobApplication.job_title, postgresql_using="gin", postgresql_ops={"job_title": "gin_trgm_ops"})
 
 # Pydantic Models (API/Data Validation)
 class ResumeVersionCreate(BaseModel):
@@ -70,8 +109,7 @@ class ResumeVersionResponse(BaseModel):
   is_default: bool
   created_at: datetime
   
-  class Config:
-      from_attributes = True
+  model_config = ConfigDict(from_attributes=True)
 
 class JobApplicationCreate(BaseModel):
   job_title: str
@@ -106,5 +144,4 @@ class JobApplicationResponse(BaseModel):
   created_at: datetime
   updated_at: datetime
   
-  class Config:
-    from_attributes = True
\ No newline at end of file
+  model_config = ConfigDict(from_attributes=True)
\ No newline at end of file
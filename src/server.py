@@ -1,8 +1,12 @@
 import asyncio
-import json
-from typing import Any, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Any, Awaitable, Callable, Iterator, Optional, Sequence
 from datetime import date, datetime, timedelta
 
+import fastjsonschema
+from sqlalchemy import Row
+from sqlalchemy.exc import IntegrityError
 from mcp.server.models import InitializationOptions
 from mcp.server import NotificationOptions, Server
 from mcp.types import (
@@ -15,401 +19,558 @@ from mcp.types import (
 )
 import mcp.types as types
 
-from .database import db
+from .database import get_db
 from .models import JobApplicationCreate, ResumeVersionCreate, JobApplication, ResumeVersion
 
 # Create the MCP server
 server = Server("job-tracker-mcp")
 
-def parse_date(date_str: str) -> date:
-    """Parse date from various formats"""
-    if date_str.lower() == "today":
-        return date.today()
-    elif date_str.lower() == "yesterday":
-        return date.today() - timedelta(days=1)
-    else:
+@lru_cache(maxsize=256)
+def _parse_date_string(date_str: str) -> Optional[date]:
+    """Parse an explicit MM/DD/YYYY or YYYY-MM-DD date (memoized; relative dates are not cached)"""
+    # Pick the one format that can match instead of trying each in turn
+    try:
+        if "/" in date_str:
+            return datetime.strptime(date_str, "%m/%d/%Y").date()
         try:
-            return datetime.strptime(date_str, "%Y-%m-%d").date()
+            return date.fromisoformat(date_str)
         except ValueError:
-            try:
-                return datetime.strptime(date_str, "%m/%d/%Y").date()
-            except ValueError:
-                return date.today()  # fallback to today
+            # fromisoformat needs zero padding; strptime also takes "2024-1-5"
+            return datetime.strptime(date_str, "%Y-%m-%d").date()
+    except ValueError:
+        return None
 
-@server.list_tools()
-async def handle_list_tools() -> list[Tool]:
-    """List available MCP tools"""
-    return [
-        Tool(
-            name="add_job_application",
-            description="Add a new job application to track",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "job_title": {"type": "string", "description": "Job title/position"},
-                    "company_name": {"type": "string", "description": "Company name"},
-                    "application_date": {"type": "string", "description": "Date applied (YYYY-MM-DD, today, yesterday)"},
-                    "status": {"type": "string", "description": "Application status", "default": "applied"},
-                    "job_url": {"type": "string", "description": "URL to job posting"},
-                    "salary_range": {"type": "string", "description": "Salary range if known"},
-                    "location": {"type": "string", "description": "Job location"},
-                    "job_source": {"type": "string", "description": "Where you found the job (LinkedIn, Indeed, etc.)"},
-                    "recruiter_name": {"type": "string", "description": "Recruiter contact name"},
-                    "recruiter_email": {"type": "string", "description": "Recruiter email"},
-                    "notes": {"type": "string", "description": "Additional notes"},
-                    "resume_version": {"type": "string", "description": "Resume version used (will use default if available)"}
-                },
-                "required": ["job_title", "company_name"]
+# Relative date keywords -> days before today
+_RELATIVE_DATES = {"today": 0, "yesterday": 1}
+
+def parse_date(date_str: str) -> date:
+    """Parse date from various formats"""
+    date_str = date_str.strip()
+    days_back = _RELATIVE_DATES.get(date_str.lower())
+    if days_back is not None:
+        return date.today() - timedelta(days=days_back)
+    return _parse_date_string(date_str) or date.today()  # fallback to today
+
+# Tool definitions never change, so build them once at import
+_TOOLS_LIST: list[Tool] = [
+    Tool(
+        name="add_job_application",
+        description="Add a new job application to track",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "job_title": {"type": "string", "description": "Job title/position"},
+                "company_name": {"type": "string", "description": "Company name"},
+                "application_date": {"type": "string", "description": "Date applied (YYYY-MM-DD, today, yesterday)"},
+                "status": {"type": "string", "description": "Application status", "default": "applied"},
+                "job_url": {"type": "string", "description": "URL to job posting"},
+                "salary_range": {"type": "string", "description": "Salary range if known"},
+                "location": {"type": "string", "description": "Job location"},
+                "job_source": {"type": "string", "description": "Where you found the job (LinkedIn, Indeed, etc.)"},
+                "recruiter_name": {"type": "string", "description": "Recruiter contact name"},
+                "recruiter_email": {"type": "string", "description": "Recruiter email"},
+                "notes": {"type": "string", "description": "Additional notes"},
+                "resume_version": {"type": "string", "description": "Resume version used (will use default if available)"}
+            },
+            "required": ["job_title", "company_name"]
+        }
+    ),
+    Tool(
+        name="get_applications",
+        description="Get job applications, optionally filtered by status, company, or job title",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "status": {"type": "string", "description": "Filter by status (applied, interviewing, rejected, etc.)"},
+                "company_name": {"type": "string", "description": "Filter by company name"},
+                "job_title": {"type": "string", "description": "Filter by job title"},
+                "limit": {"type": "integer", "description": "Maximum number of results", "default": 10, "minimum": 1}
             }
-        ),
-        Tool(
-            name="get_applications",
-            description="Get job applications, optionally filtered by status, company, or job title",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "status": {"type": "string", "description": "Filter by status (applied, interviewing, rejected, etc.)"},
-                    "company_name": {"type": "string", "description": "Filter by company name"},
-                    "job_title": {"type": "string", "description": "Filter by job title"},
-                    "limit": {"type": "integer", "description": "Maximum number of results", "default": 10}
+        }
+    ),
+    Tool(
+        name="update_application_status",
+        description="Update the status of a job application",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "application_id": {"type": "integer", "description": "Application ID"},
+                "new_status": {"type": "string", "description": "New status"},
+                "notes": {"type": "string", "description": "Additional notes about the update"}
+            },
+            "required": ["application_id", "new_status"]
+        }
+    ),
+    Tool(
+        name="add_resume_version",
+        description="Add a new resume version with text content",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "name": {"type": "string", "description": "Resume version name (e.g., 'backend-focused', 'frontend-focused', 'senior-level')"},
+                "content": {"type": "string", "description": "Complete resume text content"},
+                "description": {"type": "string", "description": "Description of this resume version"},
+                "set_as_default": {"type": "boolean", "description": "Set this resume as the default", "default": False}
+            },
+            "required": ["name", "content"]
+        }
+    ),
+    Tool(
+        name="add_resume_versions_batch",
+        description="Add several resume versions at once (all or nothing)",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "resumes": {
+                    "type": "array",
+                    "minItems": 1,
+                    "description": "Resume versions to add",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "name": {"type": "string", "description": "Resume version name"},
+                            "content": {"type": "string", "description": "Complete resume text content"},
+                            "description": {"type": "string", "description": "Description of this resume version"},
+                            "set_as_default": {"type": "boolean", "description": "Set this resume as the default", "default": False}
+                        },
+                        "required": ["name", "content"]
+                    }
+                }
+            },
+            "required": ["resumes"]
+        }
+    ),
+    Tool(
+        name="set_default_resume",
+        description="Mark an existing resume as the default resume",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "resume_name": {"type": "string", "description": "Name of the resume to set as default"}
+            },
+            "required": ["resume_name"]
+        }
+    ),
+    Tool(
+        name="get_resume_content",
+        description="Get the content of a specific resume version",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "resume_name": {"type": "string", "description": "Name of the resume to retrieve"}
+            },
+            "required": ["resume_name"]
+        }
+    ),
+    Tool(
+        name="list_resumes",
+        description="List all resume versions",
+        inputSchema={"type": "object", "properties": {}}
+    ),
+    Tool(
+        name="get_application_stats",
+        description="Get statistics about job applications",
+        inputSchema={"type": "object", "properties": {}}
+    )
+]
+
+# batch_tool can run any of the tools above (but not itself)
+_TOOLS_LIST.append(Tool(
+    name="batch_tool",
+    description="Run several tool calls in one request and one database transaction, in order; results are returned in the same order. If a call fails in the database, none of the batch's changes are saved",
+    inputSchema={
+        "type": "object",
+        "properties": {
+            "calls": {
+                "type": "array",
+                "minItems": 1,
+                "description": "Tool calls to run",
+                "items": {
+                    "type": "object",
+                    "properties": {
+                        "name": {"type": "string", "enum": [tool.name for tool in _TOOLS_LIST], "description": "Tool name"},
+                        "arguments": {"type": "object", "description": "Arguments for the tool", "default": {}}
+                    },
+                    "required": ["name"]
                 }
             }
-        ),
-        Tool(
-            name="update_application_status",
-            description="Update the status of a job application",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "application_id": {"type": "integer", "description": "Application ID"},
-                    "new_status": {"type": "string", "description": "New status"},
-                    "notes": {"type": "string", "description": "Additional notes about the update"}
-                },
-                "required": ["application_id", "new_status"]
-            }
-        ),
-        Tool(
-            name="add_resume_version",
-            description="Add a new resume version with text content",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "name": {"type": "string", "description": "Resume version name (e.g., 'backend-focused', 'frontend-focused', 'senior-level')"},
-                    "content": {"type": "string", "description": "Complete resume text content"},
-                    "description": {"type": "string", "description": "Description of this resume version"},
-                    "set_as_default": {"type": "boolean", "description": "Set this resume as the default", "default": False}
-                },
-                "required": ["name", "content"]
-            }
-        ),
-        Tool(
-            name="set_default_resume",
-            description="Mark an existing resume as the default resume",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "resume_name": {"type": "string", "description": "Name of the resume to set as default"}
-                },
-                "required": ["resume_name"]
-            }
-        ),
-        Tool(
-            name="get_resume_content",
-            description="Get the content of a specific resume version",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "resume_name": {"type": "string", "description": "Name of the resume to retrieve"}
-                },
-                "required": ["resume_name"]
-            }
-        ),
-        Tool(
-            name="list_resumes",
-            description="List all resume versions",
-            inputSchema={"type": "object", "properties": {}}
-        ),
-        Tool(
-            name="get_application_stats",
-            description="Get statistics about job applications",
-            inputSchema={"type": "object", "properties": {}}
+        },
+        "required": ["calls"]
+    }
+))
+
+# Argument validators compiled from each tool's inputSchema; fills in schema defaults
+_VALIDATORS = {tool.name: fastjsonschema.compile(tool.inputSchema) for tool in _TOOLS_LIST}
+
+@server.list_tools()
+async def handle_list_tools() -> list[Tool]:
+    """List available MCP tools"""
+    return _TOOLS_LIST
+
+# Response templates, parsed once and filled with str.format_map
+_ADD_APP_TEMPLATE = (
+    "✅ Added job application:\n"
+    "• Job: {job_title}\n"
+    "• Company: {company_name}\n"
+    "• Date: {application_date}\n"
+    "• Status: {status}\n"
+    "• Resume: {resume}\n"
+    "• Application ID: {id}"
+)
+_APP_ROW_TEMPLATE = (
+    "• **{job_title}** at **{company_name}**\n"
+    "  Applied: {application_date} | Status: {status} | Resume: {resume}\n"
+)
+_UPDATE_STATUS_TEMPLATE = (
+    "✅ Updated application status:\n"
+    "• Job: {job_title} at {company_name}\n"
+    "• Status: {old_status} → {new_status}\n"
+    "• Application ID: {id}"
+)
+_ADD_RESUME_TEMPLATE = (
+    "✅ Added resume version:\n"
+    "• Name: {name}{default_status}\n"
+    "• Description: {description}\n"
+    "• Content length: {length} characters\n"
+    "• Resume ID: {id}"
+)
+_RESUME_BATCH_ROW_TEMPLATE = "• {name}{default_status} (Resume ID: {id})\n"
+_DEFAULT_SET_TEMPLATE = (
+    "✅ Resume '{name}' is now set as the DEFAULT resume.\n"
+    "It will be automatically used for new job applications unless specified otherwise."
+)
+_RESUME_CONTENT_TEMPLATE = (
+    "**Resume: {name}{default_marker}**\n\n"
+    "**Description:** {description}\n\n"
+    "**Content:**\n```\n{content}\n```"
+)
+_RESUME_ROW_TEMPLATE = "• **{name}**{default_marker}\n"
+
+async def _add_job_application(arguments: dict) -> list[types.TextContent]:
+    """Add a new job application"""
+    # Parse and validate data
+    app_date = parse_date(arguments.get("application_date", "today"))
+    
+    # Arguments were already type-checked by the tool's validator, so skip re-validating them
+    app_data = JobApplicationCreate.model_construct(
+        job_title=arguments["job_title"],
+        company_name=arguments["company_name"],
+        application_date=app_date,
+        status=arguments.get("status", "applied"),
+        job_url=arguments.get("job_url"),
+        salary_range=arguments.get("salary_range"),
+        location=arguments.get("location"),
+        job_source=arguments.get("job_source"),
+        recruiter_name=arguments.get("recruiter_name"),
+        recruiter_email=arguments.get("recruiter_email"),
+        notes=arguments.get("notes"),
+        resume_version_name=arguments.get("resume_version")
+    )
+    
+    # Returned with resume_name filled in by the INSERT ... RETURNING
+    application = await asyncio.to_thread(get_db().add_job_application, app_data)
+    resume_used = application.resume_name or "No resume assigned"
+    
+    return [types.TextContent(
+        type="text",
+        text=_ADD_APP_TEMPLATE.format_map({
+            "job_title": application.job_title,
+            "company_name": application.company_name,
+            "application_date": application.application_date,
+            "status": application.status,
+            "resume": resume_used,
+            "id": application.id,
+        })
+    )]
+
+async def _get_applications(arguments: dict) -> list[types.TextContent]:
+    """Get job applications, optionally filtered"""
+    # Get applications based on filters
+    status = arguments.get("status")
+    company_name = arguments.get("company_name")
+    job_title = arguments.get("job_title")
+    limit = arguments.get("limit", 10)
+    
+    # Filtering and LIMIT happen in SQL; the DB call runs in a worker thread to keep the event loop free
+    if status or company_name or job_title:
+        applications = await asyncio.to_thread(
+            get_db().search_application_rows, company_name, job_title, status=status, limit=limit
         )
+    else:
+        # Common "latest N" request: prebuilt statement, nothing to assemble per call
+        applications = await asyncio.to_thread(get_db().latest_applications, limit)
+    
+    if not applications:
+        return [types.TextContent(type="text", text="No applications found matching your criteria.")]
+    
+    return list(_application_chunks(applications))
+
+# Rows per TextContent block in get_applications responses
+_APPLICATION_CHUNK_SIZE = 50
+
+def _application_chunks(applications: Sequence[Row]) -> Iterator[types.TextContent]:
+    """Render applications as TextContent blocks of up to _APPLICATION_CHUNK_SIZE rows each"""
+    parts = [f"Found {len(applications)} application(s):\n\n"]
+    for i, app in enumerate(applications, 1):
+        parts.append(_APP_ROW_TEMPLATE.format_map({
+            "job_title": app.job_title,
+            "company_name": app.company_name,
+            "application_date": app.application_date,
+            "status": app.status,
+            "resume": app.resume_name or "No resume",
+        }))
+        if app.salary_range:
+            parts.append(f"  Salary: {app.salary_range}\n")
+        if app.notes:
+            parts.append(f"  Notes: {app.notes}\n")
+        parts.append(f"  ID: {app.id}\n\n")
+        
+        if i % _APPLICATION_CHUNK_SIZE == 0:
+            yield types.TextContent(type="text", text="".join(parts))
+            parts = []
+    
+    if parts:
+        yield types.TextContent(type="text", text="".join(parts))
+
+async def _update_application_status(arguments: dict) -> list[types.TextContent]:
+    """Update the status of a job application"""
+    app_id = arguments["application_id"]
+    new_status = arguments["new_status"]
+    notes = arguments.get("notes", "")
+    
+    updated = await asyncio.to_thread(get_db().update_application_status, app_id, new_status, notes)
+    if not updated:
+        return [types.TextContent(type="text", text=f"❌ Application with ID {app_id} not found.")]
+    
+    application, old_status = updated
+    return [types.TextContent(
+        type="text",
+        text=_UPDATE_STATUS_TEMPLATE.format_map({
+            "job_title": application.job_title,
+            "company_name": application.company_name,
+            "old_status": old_status,
+            "new_status": new_status,
+            "id": app_id,
+        })
+    )]
+
+async def _add_resume_version(arguments: dict) -> list[types.TextContent]:
+    """Add a new resume version"""
+    resume_data = ResumeVersionCreate.model_construct(
+        name=arguments["name"],
+        content=arguments["content"],
+        description=arguments.get("description"),
+        is_default=arguments.get("set_as_default", False)
+    )
+    
+    try:
+        resume = await asyncio.to_thread(get_db().add_resume_version, resume_data)
+    except IntegrityError:
+        return [types.TextContent(
+            type="text", 
+            text=f"❌ Resume name '{arguments['name']}' already exists. Please use a different name or update the existing resume."
+        )]
+    
+    default_status = " and set as DEFAULT" if resume.is_default else ""
+    
+    return [types.TextContent(
+        type="text",
+        text=_ADD_RESUME_TEMPLATE.format_map({
+            "name": resume.name,
+            "default_status": default_status,
+            "description": resume.description or 'None',
+            "length": len(resume.content) if resume.content else 0,
+            "id": resume.id,
+        })
+    )]
+
+async def _add_resume_versions_batch(arguments: dict) -> list[types.TextContent]:
+    """Add several resume versions in one transaction"""
+    items = [
+        ResumeVersionCreate.model_construct(
+            name=item["name"],
+            content=item["content"],
+            description=item.get("description"),
+            is_default=item.get("set_as_default", False)
+        )
+        for item in arguments["resumes"]
     ]
+    
+    try:
+        resumes = await asyncio.to_thread(get_db().bulk_add_resume_versions, items)
+    except IntegrityError:
+        return [types.TextContent(
+            type="text",
+            text="❌ One or more resume names already exist (or are repeated). No resumes were added."
+        )]
+    
+    parts = [f"✅ Added {len(resumes)} resume version(s):\n"]
+    for resume in resumes:
+        default_status = " and set as DEFAULT" if resume.is_default else ""
+        parts.append(_RESUME_BATCH_ROW_TEMPLATE.format_map({
+            "name": resume.name,
+            "default_status": default_status,
+            "id": resume.id,
+        }))
+    
+    return [types.TextContent(type="text", text="".join(parts))]
 
-@server.call_tool()
+async def _set_default_resume(arguments: dict) -> list[types.TextContent]:
+    """Mark an existing resume as the default"""
+    resume_name = arguments["resume_name"]
+    
+    # Set as default (False means no resume has this name)
+    if not await asyncio.to_thread(get_db().set_resume_as_default, resume_name):
+        available_resumes = await asyncio.to_thread(get_db().list_resumes)
+        if not available_resumes:
+            return [types.TextContent(
+                type="text",
+                text="❌ No resumes found. Please add a resume first using add_resume_version."
+            )]
+        return [types.TextContent(
+            type="text",
+            text="\n".join([f"❌ Resume '{resume_name}' not found. Available resumes:"] + [f"• {r.name}" for r in available_resumes])
+        )]
+    
+    return [types.TextContent(
+        type="text",
+        text=_DEFAULT_SET_TEMPLATE.format_map({"name": resume_name})
+    )]
+
+async def _get_resume_content(arguments: dict) -> list[types.TextContent]:
+    """Get the content of a resume version"""
+    resume_name = arguments["resume_name"]
+    resume = await asyncio.to_thread(get_db().get_resume_by_name, resume_name)
+    
+    if not resume:
+        return [types.TextContent(
+            type="text",
+            text=f"❌ Resume '{resume_name}' not found."
+        )]
+    
+    default_marker = " (DEFAULT)" if resume.is_default else ""
+    
+    return [types.TextContent(
+        type="text",
+        text=_RESUME_CONTENT_TEMPLATE.format_map({
+            "name": resume.name,
+            "default_marker": default_marker,
+            "description": resume.description or 'None',
+            "content": resume.content,
+        })
+    )]
+
+async def _list_resumes(arguments: dict) -> list[types.TextContent]:
+    """List all resume versions"""
+    resumes = await asyncio.to_thread(get_db().list_resumes)
+    
+    if not resumes:
+        return [types.TextContent(type="text", text="No resume versions found. Add your first resume using add_resume_version.")]
+    
+    parts = [f"Found {len(resumes)} resume version(s):\n\n"]
+    for resume in resumes:
+        default_marker = " ⭐ (DEFAULT)" if resume.is_default else ""
+        parts.append(_RESUME_ROW_TEMPLATE.format_map({"name": resume.name, "default_marker": default_marker}))
+        if resume.description:
+            parts.append(f"  Description: {resume.description}\n")
+        parts.append(f"  Created: {resume.created_at.date().isoformat()}\n")
+        parts.append(f"  ID: {resume.id}\n\n")
+    
+    return [types.TextContent(type="text", text="".join(parts))]
+
+async def _get_application_stats(arguments: dict) -> list[types.TextContent]:
+    """Get statistics about job applications"""
+    # Aggregation happens in SQL (GROUP BY) and is cached until the next application write
+    total, status_counts, top_companies, resume_counts = await asyncio.to_thread(get_db().get_application_stats)
+    
+    if not total:
+        return [types.TextContent(type="text", text="No applications found.")]
+    
+    parts = [f"📊 **Job Application Statistics**\n\n"]
+    parts.append(f"**Total Applications:** {total}\n\n")
+    
+    parts.append("**By Status:**\n")
+    for status, count in sorted(status_counts.items()):
+        parts.append(f"• {status}: {count}\n")
+    
+    parts.append("\n**Top Companies:**\n")
+    for company, count in top_companies:
+        parts.append(f"• {company}: {count}\n")
+    
+    parts.append("\n**By Resume Version:**\n")
+    for resume, count in sorted((name or "No resume", count) for name, count in resume_counts.items()):
+        parts.append(f"• {resume}: {count}\n")
+    
+    return [types.TextContent(type="text", text="".join(parts))]
+
+async def _batch_tool(arguments: dict) -> list[types.TextContent]:
+    """Run several tool calls in order on one DB session and transaction, committed once at the end"""
+    # Sequential so later calls see earlier writes (e.g. add a resume, then use it)
+    results = []
+    with get_db().request_scope() as session:
+        for i, call in enumerate(arguments["calls"], 1):
+            results.append(types.TextContent(type="text", text=f"**[{i}] {call['name']}**"))
+            results.extend(await handle_call_tool(call["name"], call.get("arguments")))
+            if session.info.get("rolled_back"):
+                results.append(types.TextContent(
+                    type="text", text=f"❌ Batch stopped at call {i}; no changes from this batch were saved."
+                ))
+                break
+        # Commit off the event loop; request_scope's own commit then has nothing left to do
+        await asyncio.to_thread(session.commit)
+    return results
+
+# Tool name -> handler
+_HANDLERS: dict[str, Callable[[dict], Awaitable[list[types.TextContent]]]] = {
+    "add_job_application": _add_job_application,
+    "get_applications": _get_applications,
+    "update_application_status": _update_application_status,
+    "add_resume_version": _add_resume_version,
+    "add_resume_versions_batch": _add_resume_versions_batch,
+    "set_default_resume": _set_default_resume,
+    "get_resume_content": _get_resume_content,
+    "list_resumes": _list_resumes,
+    "get_application_stats": _get_application_stats,
+    "batch_tool": _batch_tool,
+}
+
+@server.call_tool(validate_input=False)  # Arguments are checked against _VALIDATORS below
 async def handle_call_tool(name: str, arguments: dict | None) -> list[types.TextContent]:
     """Handle tool calls from Claude"""
     
     if arguments is None:
         arguments = {}
     
+    validator = _VALIDATORS.get(name)
+    if validator:
+        try:
+            arguments = validator(arguments)
+        except fastjsonschema.JsonSchemaException as e:
+            return [types.TextContent(type="text", text=f"❌ Invalid arguments for {name}: {e.message}")]
+    
+    handler = _HANDLERS.get(name)
+    if handler is None:
+        return [types.TextContent(type="text", text=f"Unknown tool: {name}")]
+    
     try:
-        if name == "add_job_application":
-            # Parse and validate data
-            app_date = parse_date(arguments.get("application_date", "today"))
-            
-            app_data = JobApplicationCreate(
-                job_title=arguments["job_title"],
-                company_name=arguments["company_name"],
-                application_date=app_date,
-                status=arguments.get("status", "applied"),
-                job_url=arguments.get("job_url"),
-                salary_range=arguments.get("salary_range"),
-                location=arguments.get("location"),
-                job_source=arguments.get("job_source"),
-                recruiter_name=arguments.get("recruiter_name"),
-                recruiter_email=arguments.get("recruiter_email"),
-                notes=arguments.get("notes"),
-                resume_version_name=arguments.get("resume_version")
-            )
-            
-            application = db.add_job_application(app_data)
-            
-            # Get full application with resume info
-            full_app = db.get_application_with_resume(application.id)
-            resume_used = full_app.resume_version.name if full_app and full_app.resume_version else "No resume assigned"
-            
-            return [types.TextContent(
-                type="text",
-                text=f"✅ Added job application:\n"
-                     f"• Job: {application.job_title}\n"
-                     f"• Company: {application.company_name}\n"
-                     f"• Date: {application.application_date}\n"
-                     f"• Status: {application.status}\n"
-                     f"• Resume: {resume_used}\n"
-                     f"• Application ID: {application.id}"
-            )]
-            
-        elif name == "get_applications":
-            # Get applications based on filters
-            status = arguments.get("status")
-            company_name = arguments.get("company_name")
-            job_title = arguments.get("job_title")
-            limit = arguments.get("limit", 10)
-            
-            if status:
-                applications = db.get_applications_by_status(status)
-            elif company_name or job_title:
-                applications = db.search_applications(company_name, job_title)
-            else:
-                applications = db.get_all_applications_with_resumes()
-            
-            # Limit results
-            applications = applications[:limit]
-            
-            if not applications:
-                return [types.TextContent(type="text", text="No applications found matching your criteria.")]
-            
-            result = f"Found {len(applications)} application(s):\n\n"
-            for app in applications:
-                resume_name = "No resume"
-                try:
-                    if hasattr(app, 'resume_version') and app.resume_version:
-                        resume_name = app.resume_version.name
-                except:
-                    # Handle session issues
-                    full_app = db.get_application_with_resume(app.id)
-                    if full_app and full_app.resume_version:
-                        resume_name = full_app.resume_version.name
-                
-                result += f"• **{app.job_title}** at **{app.company_name}**\n"
-                result += f"  Applied: {app.application_date} | Status: {app.status} | Resume: {resume_name}\n"
-                if app.salary_range:
-                    result += f"  Salary: {app.salary_range}\n"
-                if app.notes:
-                    result += f"  Notes: {app.notes}\n"
-                result += f"  ID: {app.id}\n\n"
-            
-            return [types.TextContent(type="text", text=result)]
-            
-        elif name == "update_application_status":
-            app_id = arguments["application_id"]
-            new_status = arguments["new_status"]
-            notes = arguments.get("notes", "")
-            
-            # Get the application
-            session = db.get_session()
-            try:
-                application = session.query(JobApplication).filter(JobApplication.id == app_id).first()
-                if not application:
-                    return [types.TextContent(type="text", text=f"❌ Application with ID {app_id} not found.")]
-                
-                old_status = application.status
-                application.status = new_status
-                
-                if notes:
-                    if application.notes:
-                        application.notes += f"\n[{datetime.now().strftime('%Y-%m-%d')}] {notes}"
-                    else:
-                        application.notes = f"[{datetime.now().strftime('%Y-%m-%d')}] {notes}"
-                
-                session.commit()
-                
-                return [types.TextContent(
-                    type="text",
-                    text=f"✅ Updated application status:\n"
-                         f"• Job: {application.job_title} at {application.company_name}\n"
-                         f"• Status: {old_status} → {new_status}\n"
-                         f"• Application ID: {app_id}"
-                )]
-            finally:
-                session.close()
-                
-        elif name == "add_resume_version":
-            resume_data = ResumeVersionCreate(
-                name=arguments["name"],
-                content=arguments["content"],
-                description=arguments.get("description"),
-                is_default=arguments.get("set_as_default", False)
-            )
-            
-            try:
-                resume = db.add_resume_version(resume_data)
-                
-                default_status = " and set as DEFAULT" if resume.is_default else ""
-                
-                return [types.TextContent(
-                    type="text",
-                    text=f"✅ Added resume version:\n"
-                         f"• Name: {resume.name}{default_status}\n"
-                         f"• Description: {resume.description or 'None'}\n"
-                         f"• Content length: {len(resume.content) if resume.content else 0} characters\n"
-                         f"• Resume ID: {resume.id}"
-                )]
-            except Exception as e:
-                if "unique constraint" in str(e).lower():
-                    return [types.TextContent(
-                        type="text", 
-                        text=f"❌ Resume name '{arguments['name']}' already exists. Please use a different name or update the existing resume."
-                    )]
-                else:
-                    raise e
-            
-        elif name == "set_default_resume":
-            resume_name = arguments["resume_name"]
-            
-            # Check if resume exists
-            resume = db.get_resume_by_name(resume_name)
-            if not resume:
-                available_resumes = db.list_resumes()
-                if not available_resumes:
-                    return [types.TextContent(
-                        type="text",
-                        text="❌ No resumes found. Please add a resume first using add_resume_version."
-                    )]
-                return [types.TextContent(
-                    type="text",
-                    text=f"❌ Resume '{resume_name}' not found. Available resumes:\n" + 
-                         "\n".join([f"• {r.name}" for r in available_resumes])
-                )]
-            
-            # Set as default
-            session = db.get_session()
-            try:
-                # Unset all other defaults
-                session.query(ResumeVersion).update({"is_default": False})
-                
-                # Set this one as default
-                resume.is_default = True
-                session.add(resume)
-                session.commit()
-                
-                return [types.TextContent(
-                    type="text",
-                    text=f"✅ Resume '{resume_name}' is now set as the DEFAULT resume.\n"
-                         f"It will be automatically used for new job applications unless specified otherwise."
-                )]
-            except Exception as e:
-                session.rollback()
-                raise e
-            finally:
-                session.close()    
-        
-        elif name == "get_resume_content":
-            resume_name = arguments["resume_name"]
-            resume = db.get_resume_by_name(resume_name)
-            
-            if not resume:
-                return [types.TextContent(
-                    type="text",
-                    text=f"❌ Resume '{resume_name}' not found."
-                )]
-            
-            default_marker = " (DEFAULT)" if resume.is_default else ""
-            
-            return [types.TextContent(
-                type="text",
-                text=f"**Resume: {resume.name}{default_marker}**\n\n"
-                     f"**Description:** {resume.description or 'None'}\n\n"
-                     f"**Content:**\n```\n{resume.content}\n```"
-            )]
-        
-        elif name == "list_resumes":
-            resumes = db.list_resumes()
-            
-            if not resumes:
-                return [types.TextContent(type="text", text="No resume versions found. Add your first resume using add_resume_version.")]
-            
-            result = f"Found {len(resumes)} resume version(s):\n\n"
-            for resume in resumes:
-                default_marker = " ⭐ (DEFAULT)" if resume.is_default else ""
-                result += f"• **{resume.name}**{default_marker}\n"
-                if resume.description:
-                    result += f"  Description: {resume.description}\n"
-                result += f"  Created: {resume.created_at.strftime('%Y-%m-%d')}\n"
-                result += f"  ID: {resume.id}\n\n"
-            
-            return [types.TextContent(type="text", text=result)]
-            
-        elif name == "get_application_stats":
-            all_applications = db.get_all_applications_with_resumes()
-            
-            if not all_applications:
-                return [types.TextContent(type="text", text="No applications found.")]
-            
-            # Calculate stats
-            total = len(all_applications)
-            status_counts = {}
-            company_counts = {}
-            resume_counts = {}
-            
-            for app in all_applications:
-                status_counts[app.status] = status_counts.get(app.status, 0) + 1
-                company_counts[app.company_name] = company_counts.get(app.company_name, 0) + 1
-                
-                resume_name = "No resume"
-                if app.resume_version:
-                    resume_name = app.resume_version.name
-                resume_counts[resume_name] = resume_counts.get(resume_name, 0) + 1
-            
-            result = f"📊 **Job Application Statistics**\n\n"
-            result += f"**Total Applications:** {total}\n\n"
-            
-            result += "**By Status:**\n"
-            for status, count in sorted(status_counts.items()):
-                result += f"• {status}: {count}\n"
-            
-            result += "\n**Top Companies:**\n"
-            sorted_companies = sorted(company_counts.items(), key=lambda x: x[1], reverse=True)[:5]
-            for company, count in sorted_companies:
-                result += f"• {company}: {count}\n"
-            
-            result += "\n**By Resume Version:**\n"
-            for resume, count in sorted(resume_counts.items()):
-                result += f"• {resume}: {count}\n"
-            
-            return [types.TextContent(type="text", text=result)]
-        
-        else:
-            return [types.TextContent(type="text", text=f"Unknown tool: {name}")]
-            
+        return await handler(arguments)
     except Exception as e:
         return [types.TextContent(type="text", text=f"❌ Error: {str(e)}")]
 
 async def main():
     """Run the MCP server"""
-    # Initialize database
-    db.create_tables()
+    # Importing this module doesn't touch the database; the engine and pool are built here
+    db = get_db()
+
+    # DB calls run via asyncio.to_thread; give its executor one worker per connection the pool can hand out
+    # (DB_POOL_SIZE=0 means an unlimited pool and DB_MAX_OVERFLOW=-1 unlimited overflow, so clamp both)
+    workers = max(1, db.pool_size + max(db.max_overflow, 0))
+    asyncio.get_running_loop().set_default_executor(
+        ThreadPoolExecutor(max_workers=workers, thread_name_prefix="job-tracker-db")
+    )
+    
+    # Initialize database and pre-open pooled connections side by side (off the event loop, like every other DB call)
+    await asyncio.gather(asyncio.to_thread(db.create_tables), asyncio.to_thread(db.warm_pool))
     
     # Run the server (no automatic default resume creation)
     from mcp.server.stdio import stdio_server
@@ -429,4 +590,9 @@ async def main():
         )
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(main())
+    else:
+        uvloop.run(main())
\ No newline at end of file